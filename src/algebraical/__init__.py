@@ -4,4 +4,5 @@ from algebraical.algebraical import \
     pos_, neg_, abs_, \
     add_, sub_, \
     mul_, matmul_, truediv_, floordiv_, mod_, \
-    pow_
+    pow_, \
+    precedence
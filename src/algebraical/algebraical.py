@@ -1,9 +1,8 @@
 """
-Subclass of the
-`built-in function type <https://docs.python.org/3/library/operator.html>`__
-for representing algebraic operators (that are typically associated with
+Class for representing algebraic operators (that are typically associated with
 algebraic structures and algebraic circuits) as immutable, hashable, sortable,
-and callable objects.
+and callable objects that wrap
+`built-in functions <https://docs.python.org/3/library/operator.html>`__.
 
 Instances of the class exported by this library can be used as gate operations
 within circuits as they are implemented within the
@@ -12,15 +11,42 @@ to complement the `logical <https://pypi.org/project/logical>`__ library for
 logical operations.
 """
 from __future__ import annotations
-from typing import Any, Tuple
-import doctest
+from typing import Any, Callable, Mapping, Tuple
+import sys
+import types
 import operator
 
-class algebraical(type(operator)):
+# The leading underscore marks this helper class as private to this module.
+class _dispatch(property): # pylint: disable=invalid-name
     """
-    Class for representing algebraic operators. This class is derived from
-    the type of the built-in functions found in the :obj:`operator` library.
-    Thus, it is possible to invoke these operators on values of
+    Property that retrieves the function that an instance wraps (so that
+    invoking an instance does not enter a Python-level method) and that can
+    also be invoked as an unbound method.
+    """
+    def __init__(self: _dispatch, fget: Callable, doc: str):
+        """
+        Create a property given a getter for the wrapped function and the
+        documentation for the method that the property emulates.
+        """
+        super().__init__(fget)
+        self.__doc__ = doc
+
+    def __call__(
+            self: _dispatch,
+            instance: Any,
+            *arguments: Tuple[Any, ...]
+        ) -> Any:
+        """
+        Apply the function retrieved from the supplied instance to zero or
+        more arguments (when this property is invoked as an unbound method).
+        """
+        return self.fget(instance)(*arguments)
+
+class algebraical:
+    """
+    Class for representing algebraic operators. Each instance wraps one of the
+    built-in functions found in the :obj:`operator` library. Thus, it is
+    possible to invoke these operators on values of
     `numeric <https://docs.python.org/3/library/stdtypes.html#numeric-types-int-float-complex>`__
     types and on objects that define the special
     `methods <https://docs.python.org/3/reference/datamodel.html#emulating-numeric-types>`__
@@ -28,14 +54,35 @@ class algebraical(type(operator)):
 
     >>> algebraical.add_(1, 2)
     3
+    >>> algebraical.sub_(3, 2)
+    1
+
+    Each instance represents a distinct built-in function.
+
+    >>> algebraical.sub_.function is not algebraical.add_.function
+    True
+    >>> len({o.function for o in algebraical.names}) == len(algebraical.names)
+    True
 
     The name and arity of an instance can be retrieved.
 
     >>> algebraical.mul_.name()
     'mul'
+    >>> algebraical.mul_.__name__
+    'mul'
     >>> algebraical.mul_.arity()
     2
 
+    The name and arity of every operator are also available in read-only
+    mappings.
+
+    >>> algebraical.names[algebraical.mul_]
+    'mul'
+    >>> algebraical.arities[algebraical.mul_] = 1
+    Traceback (most recent call last):
+      ...
+    TypeError: 'mappingproxy' object does not support item assignment
+
     Instances can be compared according to their precedence.
 
     >>> pow_ > mul_
@@ -45,46 +92,93 @@ class algebraical(type(operator)):
     >>> sorted([pow_, mul_, add_]) # From lowest to highest precedence.
     [add_, mul_, pow_]
 
+    When sorting many operators, the :obj:`precedence` function can be
+    supplied as the key (so that no comparison methods are invoked).
+
+    >>> sorted([pow_, mul_, add_], key=precedence)
+    [add_, mul_, pow_]
+
     Instances are also hashable and can be used as members of :obj:`set`
     instances and as keys within :obj:`dict` instances.
 
     >>> from algebraical import *
     >>> {add_, add_, add_}
     {add_}
+    >>> (add_ == add_, add_ == sub_)
+    (True, False)
     >>> sorted({add_: 0, mul_: 1}.items())
     [(add_, 0), (mul_, 1)]
     """
-    names: dict = None
-    """Typical concise names for operators."""
+    # Instance attributes are stored in slots so that retrieving them (such as
+    # when :obj:`__call__` retrieves the stored function) requires no
+    # dictionary lookup.
+    __slots__ = ('function', '__name__', '_repr', '_arity', '_prec')
+
+    names: Mapping = None
+    """Typical concise names for operators (as a read-only mapping)."""
+
+    arities: Mapping = None
+    """Arities of operators (as a read-only mapping)."""
 
-    arities: dict = None
-    """Arities of operators."""
+    # Operators indexed by their names (used by :obj:`from_name`).
+    _by_name: dict = None
 
     def __init__(
             self: algebraical,
             function: operator, # pylint: disable=redefined-outer-name
-            name: str
+            name: str,
+            arity: int,
+            prec: int = 0
         ):
         """
-        Create an instance given a built-in operator object.
+        Create an instance given a built-in operator object, the name and
+        arity of the operator, and an integer representing the precedence of
+        the operator (with a higher integer representing a higher precedence).
         """
-        super().__init__(name)
-
         # Store the original function for use in :obj:`__call__`.
         self.function = function
 
-    def __call__(
-            self: algebraical,
-            *arguments: Tuple[Any, ...]
-        ) -> Any:
-        """
+        # Store the attributes of the operator so that methods can retrieve
+        # them without any lookups or concatenations. As with built-in
+        # functions, the name is available as the ``__name__`` attribute. The
+        # strings are interned so that dictionaries keyed by them can use
+        # identity comparisons.
+        self.__name__: str = sys.intern(name)
+        self._repr: str = sys.intern(name + '_')
+        self._arity: int = arity
+        self._prec: int = prec
+
+    __call__ = _dispatch(
+        operator.attrgetter('function'),
+        doc="""
         Apply the function represented by this instance to zero or more
         arguments.
 
         >>> algebraical.add_(1, 2)
         3
+        >>> algebraical.__call__(algebraical.add_, 1, 2)
+        3
+
+        Invoking an instance retrieves the stored built-in function (without
+        entering a Python-level method) and applies it to the arguments
+        directly.
+
+        >>> algebraical.add_.__call__ is operator.add
+        True
+        """
+    )
+
+    @classmethod
+    def from_name(cls, name: str) -> algebraical:
+        """
+        Return the operator that has the supplied canonical concise name.
+
+        >>> algebraical.from_name('mul')
+        mul_
+        >>> all(algebraical.from_name(o.name()) is o for o in algebraical.names)
+        True
         """
-        return self.function(*arguments)
+        return cls._by_name[name] # pylint: disable=unsubscriptable-object
 
     def name(self: algebraical) -> str:
         """
@@ -93,7 +187,7 @@ class algebraical(type(operator)):
         >>> algebraical.mul_.name()
         'mul'
         """
-        return algebraical.names[self] # pylint: disable=unsubscriptable-object
+        return self.__name__
 
     def arity(self: algebraical) -> int:
         """
@@ -104,7 +198,7 @@ class algebraical(type(operator)):
         >>> algebraical.neg_.arity()
         1
         """
-        return algebraical.arities[self] # pylint: disable=unsubscriptable-object
+        return self._arity
 
     def __repr__(self: algebraical) -> str:
         """
@@ -112,37 +206,13 @@ class algebraical(type(operator)):
 
         >>> algebraical.mul_
         mul_
-        """
-        return algebraical.names[self] + '_' # pylint: disable=unsubscriptable-object
-
-    def __str__(self: algebraical) -> str:
-        """
-        String representation of this instance.
-
         >>> str(algebraical.mul_)
         'mul_'
         """
-        return repr(self)
-
-    def _precedence(self: algebraical):
-        """
-        Return an integer that represents the precedence of an operator
-        (with a higher integer representing a higher precedence).
-        """
-        if self == algebraical.abs_:
-            return 3
-        if self == algebraical.pow_:
-            return 2
-        if self in (
-            algebraical.mul_,
-            algebraical.matmul_,
-            algebraical.truediv_,
-            algebraical.floordiv_,
-            algebraical.mod_
-        ):
-            return 1
+        return self._repr
 
-        return 0
+    # The string representation is identical to the one defined above.
+    __str__ = __repr__
 
     def __lt__(self: algebraical, other: algebraical) -> bool:
         """
@@ -165,7 +235,7 @@ class algebraical(type(operator)):
         >>> sub_ > add_
         False
         """
-        return self._precedence() < other._precedence()
+        return self._prec < other._prec
 
     def __le__(self: algebraical, other: algebraical) -> bool:
         """
@@ -182,7 +252,65 @@ class algebraical(type(operator)):
         >>> mul_ >= mul_
         True
         """
-        return self._precedence() <= other._precedence()
+        return self._prec <= other._prec
+
+    def __gt__(self: algebraical, other: algebraical) -> bool:
+        """
+        Compare two operators according to their precedence, where an operator
+        with higher precedence is *greater than* an operator with lower
+        precedence.
+
+        >>> pow_ > mul_
+        True
+        >>> add_ > abs_
+        False
+
+        Operators that have the same precedence are not *greater than* one
+        another (so this method cannot be derived from :obj:`__lt__` and
+        equality using :obj:`functools.total_ordering`).
+
+        >>> sub_ > add_
+        False
+        """
+        return self._prec > other._prec
+
+    def __ge__(self: algebraical, other: algebraical) -> bool:
+        """
+        Compare two operators according to their precedence, where an operator
+        with higher precedence is *greater than or equal to* an operator with
+        lower precedence.
+
+        >>> pow_ >= mul_
+        True
+        >>> mul_ >= pow_
+        False
+        >>> sub_ >= add_
+        True
+        """
+        return self._prec >= other._prec
+
+    # Each operator is represented by exactly one instance, so equality and
+    # hashing are based on identity (even between operators that have the same
+    # precedence).
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+    def __reduce__(self: algebraical) -> tuple:
+        """
+        Return the information that :obj:`pickle` and :obj:`copy` require in
+        order to reconstruct this instance. Because each operator is
+        represented by exactly one instance, reconstruction retrieves the
+        existing instance using :obj:`from_name`.
+
+        >>> import copy, pickle
+        >>> copy.copy(add_) is add_ and copy.deepcopy(add_) is add_
+        True
+        >>> pickle.loads(pickle.dumps(add_)) is add_
+        True
+        >>> copy.deepcopy({mul_: [pow_]})
+        {mul_: [pow_]}
+        """
+        return (algebraical.from_name, (self.__name__,))
 
     pos_: algebraical = None
     """
@@ -275,18 +403,39 @@ class algebraical(type(operator)):
     8
     """
 
-# All operators as named class constants.
-algebraical.pos_ = algebraical(operator.pos, 'pos')
-algebraical.neg_ = algebraical(operator.neg, 'neg')
-algebraical.abs_ = algebraical(operator.abs, 'abs')
-algebraical.add_ = algebraical(operator.add, 'add')
-algebraical.sub_ = algebraical(operator.add, 'sub')
-algebraical.mul_ = algebraical(operator.mul, 'mul')
-algebraical.matmul_ = algebraical(operator.matmul, 'matmul')
-algebraical.truediv_ = algebraical(operator.truediv, 'truediv')
-algebraical.floordiv_ = algebraical(operator.floordiv, 'floordiv')
-algebraical.mod_ = algebraical(operator.mod, 'mod')
-algebraical.pow_ = algebraical(operator.pow, 'pow')
+# All operators as named class constants, together with the operator names and
+# arities. Each entry in the table below consists of the built-in function, the
+# name, the arity, and the precedence of an operator.
+_names = {}
+_arities = {}
+_by_name = {}
+for (_function, _name, _arity, _prec) in (
+        (operator.pos, 'pos', 1, 0),
+        (operator.neg, 'neg', 1, 0),
+        (operator.abs, 'abs', 1, 3),
+        (operator.add, 'add', 2, 0),
+        (operator.sub, 'sub', 2, 0),
+        (operator.mul, 'mul', 2, 1),
+        (operator.matmul, 'matmul', 2, 1),
+        (operator.truediv, 'truediv', 2, 1),
+        (operator.floordiv, 'floordiv', 2, 1),
+        (operator.mod, 'mod', 2, 1),
+        (operator.pow, 'pow', 2, 2)
+    ):
+    _operator = algebraical(_function, _name, _arity, _prec)
+    setattr(algebraical, _name + '_', _operator)
+    _names[_operator] = _name
+    _arities[_operator] = _arity
+    _by_name[_name] = _operator
+
+# Operator names and arities cannot be modified after they are defined.
+algebraical.names = types.MappingProxyType(_names)
+algebraical.arities = types.MappingProxyType(_arities)
+algebraical._by_name = _by_name # pylint: disable=protected-access
+
+# The temporary tables and loop variables are not part of the module namespace
+# (so the mappings above cannot be modified through them).
+del _names, _arities, _by_name, _function, _name, _arity, _prec, _operator
 
 # All operators as top-level constants.
 pos_: algebraical = algebraical.pos_
@@ -301,35 +450,10 @@ floordiv_: algebraical = algebraical.floordiv_
 mod_: algebraical = algebraical.mod_
 pow_: algebraical = algebraical.pow_
 
-# Operator names.
-algebraical.names: dict = {
-    algebraical.pos_: 'pos',
-    algebraical.neg_: 'neg',
-    algebraical.abs_: 'abs',
-    algebraical.add_: 'add',
-    algebraical.sub_: 'sub',
-    algebraical.mul_: 'mul',
-    algebraical.matmul_: 'matmul',
-    algebraical.truediv_: 'truediv',
-    algebraical.floordiv_: 'floordiv',
-    algebraical.mod_: 'mod',
-    algebraical.pow_: 'pow'
-}
-
-# Operator arities.
-algebraical.arities: dict = {
-    algebraical.pos_: 1,
-    algebraical.neg_: 1,
-    algebraical.abs_: 1,
-    algebraical.add_: 2,
-    algebraical.sub_: 2,
-    algebraical.mul_: 2,
-    algebraical.matmul_: 2,
-    algebraical.truediv_: 2,
-    algebraical.floordiv_: 2,
-    algebraical.mod_: 2,
-    algebraical.pow_: 2
-}
+# Function for retrieving the precedence of an operator (suitable for use as a
+# sorting key).
+precedence: Callable[[algebraical], int] = operator.attrgetter('_prec')
 
 if __name__ == '__main__':
+    import doctest # pylint: disable=import-outside-toplevel # pragma: no cover
     doctest.testmod() # pragma: no cover